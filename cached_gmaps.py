@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Disk-cached wrapper around googlemaps.Client for the diagnostic scripts
+"""
+
+import hashlib
+import json
+import os
+import shelve
+import threading
+import time
+
+import googlemaps
+
+_CACHE_DIR = os.path.expanduser('~/.cache/calendar_agent')
+_CACHE_TTL = 86400  # 24 hours - bounded caching per the Maps ToS
+
+class CachedClient:
+    """googlemaps.Client wrapper that memoizes responses on disk.
+
+    The diagnostic scripts issue the same geocode/places probes on every
+    run, each a ~200ms billable network round-trip. Responses are keyed
+    by (endpoint, arguments) in a shelve store under ~/.cache and
+    replayed for 24 hours, so repeat runs cost pure dict lookups.
+    """
+
+    def __init__(self, key):
+        self._client = googlemaps.Client(key=key)
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        self._store = shelve.open(os.path.join(_CACHE_DIR, 'gmaps'))
+        # shelve is not safe for concurrent access, and the diagnostic
+        # scripts share one client across worker threads
+        self._lock = threading.Lock()
+
+    def _cached_call(self, endpoint, method, *args, **kwargs):
+        payload = json.dumps([endpoint, args, sorted(kwargs.items())],
+                             default=str, separators=(',', ':'))
+        cache_key = hashlib.sha1(payload.encode()).hexdigest()
+        with self._lock:
+            cached = self._store.get(cache_key)
+        if cached and time.time() - cached[0] < _CACHE_TTL:
+            return cached[1]
+
+        result = method(*args, **kwargs)
+        try:
+            with self._lock:
+                self._store[cache_key] = (time.time(), result)
+                self._store.sync()
+        except Exception as e:
+            print(f"⚠️ Could not write gmaps cache entry: {e}")
+        return result
+
+    def geocode(self, *args, **kwargs):
+        return self._cached_call('geocode', self._client.geocode, *args, **kwargs)
+
+    def places(self, *args, **kwargs):
+        return self._cached_call('places', self._client.places, *args, **kwargs)
+
+    def places_nearby(self, *args, **kwargs):
+        return self._cached_call('places_nearby', self._client.places_nearby, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # Anything without a cached wrapper falls through to the real client
+        return getattr(self._client, name)
+
+    def close(self):
+        try:
+            self._store.close()
+        except Exception:
+            pass
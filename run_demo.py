@@ -4,6 +4,7 @@ Simple demo script to test the Event Agent
 """
 
 import os
+from bs4 import BeautifulSoup
 from event_agent import EventAgent
 
 def demo_basic_functionality():
@@ -40,8 +41,7 @@ def demo_basic_functionality():
     </html>
     """
     
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    soup = BeautifulSoup(sample_html, 'lxml')
     text_content = soup.get_text(separator=' ', strip=True)
     
     # Test basic extraction
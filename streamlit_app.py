@@ -1,12 +1,28 @@
 import streamlit as st
 import json
 import os
+import re
+import hashlib
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from event_agent import EventAgent
-import pandas as pd
 from dotenv import load_dotenv
 
+# pandas and event_agent (which drags in vertexai/googlemaps) are
+# imported lazily at first use - Streamlit re-executes this module top
+# on every rerun, and cold replicas pay multiple seconds for imports a
+# user who never clicks "Process Event" does not need
+
+# URL validation pattern - compiled once here because Streamlit reruns
+# the whole script on every widget interaction
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 # CRITICAL: Load .env file before any environment variable access
 # Use override=True to ensure .env values take precedence over existing environment variables
 load_dotenv(override=True)
@@ -107,6 +123,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Reset the once-per-rerun guard for the missing-credentials error
+# (the script top re-executes on every rerun, so this is per-rerun state)
+st.session_state['_cred_error_shown'] = False
+
 # Add visible debug info to the interface
 st.info("🔍 **Debug Mode Active** - Check Streamlit Cloud logs for detailed information")
 
@@ -133,8 +153,11 @@ if '/mount/src/' in os.getcwd():
     except Exception as e:
         st.error(f"❌ Connectivity test failed: {e}")
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling. Kept as a module constant so the rerun
+# path just re-emits one prebuilt string; it cannot be emitted only once
+# per session because Streamlit drops elements that are not re-declared
+# on a rerun, which would strip the styling after the first interaction
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -178,59 +201,110 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def _build_agent(vertex_project_id, google_maps_api_key):
+    """Construct the EventAgent once per process and reuse it.
+
+    Agent construction opens Vertex AI and Maps clients, so rebuilding it
+    on every rerun/button press costs seconds. st.cache_resource keys on
+    the credentials, and exceptions are not cached so a failed init is
+    retried on the next call.
+    """
+    from event_agent import EventAgent
+
+    return EventAgent(
+        vertex_project_id=vertex_project_id,
+        vertex_location='us-east1',  # Use supported region
+        google_maps_api_key=google_maps_api_key
+    )
+
+@st.cache_data(show_spinner=False)
+def _get_config():
+    """Resolve (vertex_project_id, google_maps_api_key) once per process.
+
+    The env-var/st.secrets probes run on the sidebar render path and in
+    initialize_agent on every rerun; st.secrets stats and parses a TOML
+    file on first touch, so the resolved pair is cached.
+    """
+    try:
+        vertex = os.getenv('VERTEX_PROJECT_ID') or st.secrets.get('VERTEX_PROJECT_ID', '')
+        maps_key = os.getenv('GOOGLE_MAPS_API_KEY') or st.secrets.get('GOOGLE_MAPS_API_KEY', '')
+    except Exception:
+        # No secrets.toml at all - fall back to plain env vars
+        vertex = os.getenv('VERTEX_PROJECT_ID') or ''
+        maps_key = os.getenv('GOOGLE_MAPS_API_KEY') or ''
+    return vertex, maps_key
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_find_email(place_id, name, website):
+    """Resolve a restaurant's email once per hour instead of per rerun.
+
+    Streamlit reruns the whole script on every widget interaction, and
+    display_draft_emails asks for missing emails in two separate loops -
+    without caching, each keystroke re-fires these network lookups.
+    """
+    agent = initialize_agent()
+    if not agent:
+        return ''
+    return agent._find_restaurant_email(
+        {'place_id': place_id, 'name': name, 'website': website}
+    ) or ''
+
+def _credentials_missing(vertex_project_id, google_maps_api_key):
+    """Report missing credentials and return None.
+
+    Several call sites invoke initialize_agent during a single rerun;
+    the session-state flag (reset at the top of each script run) keeps
+    the identical error block from painting more than once per rerun.
+    """
+    error_msg = f"Missing credentials - Vertex: {bool(vertex_project_id)}, Maps: {bool(google_maps_api_key)}"
+    print(f"🔍 DEBUG: {error_msg}")
+    if not st.session_state.get('_cred_error_shown'):
+        st.session_state['_cred_error_shown'] = True
+        st.error("🔐 **Configuration Required**")
+        st.error("API credentials are not properly configured. Please contact the administrator.")
+        st.error(f"Debug info: {error_msg}")
+        st.info("💡 **For administrators**: Set VERTEX_PROJECT_ID and GOOGLE_MAPS_API_KEY in your deployment environment.")
+    return None
 
 def initialize_agent():
     """Initialize the EventAgent with API credentials."""
     print("🔍 DEBUG: Starting agent initialization...")
     
-    # For production deployment, use environment variables only
-    vertex_project_id = os.getenv('VERTEX_PROJECT_ID')
-    google_maps_api_key = os.getenv('GOOGLE_MAPS_API_KEY')
-    
-    print(f"🔍 DEBUG: Environment vars - Vertex: {bool(vertex_project_id)}, Maps: {bool(google_maps_api_key)}")
-    
-    # In development mode, also check Streamlit secrets
+    # Shared cached resolution of env vars / explicit secrets
+    vertex_project_id, google_maps_api_key = _get_config()
+
+    print(f"🔍 DEBUG: Config resolved - Vertex: {bool(vertex_project_id)}, Maps: {bool(google_maps_api_key)}")
+
+    # Fast path: the Maps key has no fallback source, so bail before
+    # touching st.secrets again for the service-account probe
+    if not google_maps_api_key:
+        return _credentials_missing(vertex_project_id, google_maps_api_key)
+
+    # Last resort: derive the project from service account credentials
     try:
-        # Try to get project ID from service account credentials first
         if not vertex_project_id and "GOOGLE_APPLICATION_CREDENTIALS_JSON" in st.secrets:
             try:
-                import json
                 credentials_info = json.loads(st.secrets["GOOGLE_APPLICATION_CREDENTIALS_JSON"])
                 vertex_project_id = credentials_info.get("project_id", "")
                 print(f"🔍 DEBUG: Got Vertex project from service account: {bool(vertex_project_id)}")
             except Exception as e:
                 print(f"🔍 DEBUG: Error parsing service account JSON: {e}")
-        
-        # Fallback to explicit VERTEX_PROJECT_ID
-        if not vertex_project_id:
-            vertex_project_id = st.secrets.get('VERTEX_PROJECT_ID', '')
-            print(f"🔍 DEBUG: Got Vertex from explicit secrets: {bool(vertex_project_id)}")
-            
-        if not google_maps_api_key:
-            google_maps_api_key = st.secrets.get('GOOGLE_MAPS_API_KEY', '')
-            print(f"🔍 DEBUG: Got Maps from secrets: {bool(google_maps_api_key)}")
     except Exception as e:
         print(f"🔍 DEBUG: Error accessing secrets: {e}")
         st.error(f"Error accessing Streamlit secrets: {e}")
-    
-    if not vertex_project_id or not google_maps_api_key:
-        error_msg = f"Missing credentials - Vertex: {bool(vertex_project_id)}, Maps: {bool(google_maps_api_key)}"
-        print(f"🔍 DEBUG: {error_msg}")
-        st.error("🔐 **Configuration Required**")
-        st.error("API credentials are not properly configured. Please contact the administrator.")
-        st.error(f"Debug info: {error_msg}")
-        st.info("💡 **For administrators**: Set VERTEX_PROJECT_ID and GOOGLE_MAPS_API_KEY in your deployment environment.")
-        return None
+
+    if not vertex_project_id:
+        return _credentials_missing(vertex_project_id, google_maps_api_key)
     
     try:
         print("🔍 DEBUG: Attempting to create EventAgent...")
-        agent = EventAgent(
-            vertex_project_id=vertex_project_id,
-            vertex_location='us-east1',  # Use supported region
-            google_maps_api_key=google_maps_api_key
-        )
-        print("🔍 DEBUG: EventAgent created successfully!")
+        agent = _build_agent(vertex_project_id, google_maps_api_key)
+        print("🔍 DEBUG: EventAgent ready!")
         return agent
     except Exception as e:
         error_msg = f"Failed to initialize agent: {str(e)}"
@@ -243,6 +317,19 @@ def initialize_agent():
         st.code(traceback.format_exc())
         return None
 
+def _split_subject_body(text, default_subject):
+    """Split a draft email into (subject, body) with two partitions.
+
+    Mirrors the parsing in EventAgent.send_booking_emails: everything
+    after 'Subject:' up to the first newline is the subject, the rest is
+    the body - no per-line loop or list building.
+    """
+    _, _, tail = text.partition('Subject:')
+    if tail:
+        subject, _, body = tail.partition('\n')
+        return subject.strip(), body.strip()
+    return default_subject, text.strip()
+
 def display_event_info(event_info):
     """Display extracted event information in a nice format."""
     st.markdown('<div class="sub-header">📅 Event Information</div>', unsafe_allow_html=True)
@@ -286,31 +373,41 @@ def display_restaurants(restaurants):
         st.warning("No restaurants found in the area.")
         return
     
-    # Create a DataFrame for better display
-    restaurant_data = []
-    emails_found = 0
-    
-    for i, restaurant in enumerate(restaurants):
-        # Check if email was found
-        email_status = ""
+    # Build the DataFrame column-wise: pandas takes the columnar dict
+    # path directly instead of inferring the schema row by row
+    def email_status(restaurant):
         if restaurant.get('email'):
-            email_status = "📧 Email available"
-            emails_found += 1
-        elif restaurant.get('website'):
-            email_status = "🌐 Website available"
-        
-        restaurant_data.append({
-            'Name': restaurant.get('name', 'Unknown'),
-            'Rating': f"⭐ {restaurant.get('rating', 'N/A')}",
-            'Price Level': '💰' * (restaurant.get('price_level') or 1),
-            'Address': restaurant.get('address', 'N/A'),
-            'Phone': restaurant.get('phone', 'N/A'),
-            'Email Status': email_status,
-            'Website': restaurant.get('website', 'N/A')
-        })
-    
-    df = pd.DataFrame(restaurant_data)
-    st.dataframe(df, use_container_width=True)
+            return "📧 Email available"
+        if restaurant.get('website'):
+            return "🌐 Website available"
+        return ""
+
+    emails_found = sum(1 for r in restaurants if r.get('email'))
+
+    import pandas as pd
+
+    # Keep Rating/Price Level numeric and let the renderer format them:
+    # float32/int8 columns stay Arrow-encoded on the wire (much smaller
+    # than per-cell emoji strings) and sort numerically in the browser
+    df = pd.DataFrame({
+        'Name': [r.get('name', 'Unknown') for r in restaurants],
+        'Rating': [r.get('rating') if isinstance(r.get('rating'), (int, float)) else None
+                   for r in restaurants],
+        'Price Level': [r.get('price_level') or 1 for r in restaurants],
+        'Address': [r.get('address', 'N/A') for r in restaurants],
+        'Phone': [r.get('phone', 'N/A') for r in restaurants],
+        'Email Status': [email_status(r) for r in restaurants],
+        'Website': [r.get('website', 'N/A') for r in restaurants]
+    }, copy=False)
+    df = df.astype({'Rating': 'float32', 'Price Level': 'int8'}, copy=False)
+    st.dataframe(
+        df,
+        use_container_width=True,
+        column_config={
+            'Rating': st.column_config.NumberColumn('Rating', format='⭐ %.1f'),
+            'Price Level': st.column_config.NumberColumn('Price Level', format='💰 %d')
+        }
+    )
     
     # Show summary of email availability
     if emails_found > 0:
@@ -318,6 +415,217 @@ def display_restaurants(restaurants):
     else:
         st.info("💡 No restaurant emails found automatically. You can enter them manually in the email section below.")
 
+# st.fragment (Streamlit >= 1.37) scopes a rerun to the decorated
+# function, so a keystroke in one email card re-renders just that card
+# instead of the whole page. No-op on older Streamlit versions
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda f: f)
+
+@_fragment
+def _render_email_card(entry, agent, sender_email, sender_password, email_provider):
+    """Render one restaurant's draft-email card (fragment-scoped)."""
+    i = entry['index']
+    restaurant = entry['restaurant']
+    email_content = entry['email']
+
+    with st.expander(f"📧 Email for {restaurant.get('name', f'Restaurant {i+1}')}"):
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            # Display email content
+            st.text_area(
+                f"Draft email for {restaurant.get('name', 'Restaurant')}:",
+                value=email_content,
+                height=300,
+                key=f"email_{i}"
+            )
+            
+            # Restaurant contact info
+            if restaurant.get('phone'):
+                st.write(f"📞 **Phone:** {restaurant['phone']}")
+            if restaurant.get('website'):
+                st.write(f"🌐 **Website:** [Visit Website]({restaurant['website']})")
+        
+        with col2:
+            # Extracted restaurant email as default (resolved above)
+            extracted_email = entry['extracted_email']
+
+            # Manual email input with extracted email as default
+            restaurant_email = st.text_input(
+                "Restaurant Email",
+                value=extracted_email,
+                placeholder="restaurant@example.com" if not extracted_email else "",
+                key=f"restaurant_email_{i}",
+                help="Restaurant email address (auto-extracted if available)"
+            )
+            
+            # Show if email was auto-extracted
+            if extracted_email and extracted_email == restaurant_email:
+                st.caption("✅ Auto-extracted from restaurant data")
+            elif extracted_email:
+                st.caption("💡 Suggested email (you can edit if needed)")
+            
+            # Send individual email button
+            send_individual = st.button(
+                f"📤 Send Email",
+                key=f"send_{i}",
+                type="primary",
+                disabled=not all([sender_email, sender_password, restaurant_email])
+            )
+            
+            if send_individual:
+                if not restaurant_email:
+                    st.error("Please enter restaurant email address")
+                else:
+                    if agent:
+                        with st.spinner(f"Sending email to {restaurant.get('name', 'restaurant')}..."):
+                            # Get the edited email content from the text area widget
+                            edited_email_content = st.session_state.get(f"email_{i}", email_content)
+
+                            subject_line, body = _split_subject_body(
+                                edited_email_content,
+                                f"Table Reservation Request - {restaurant.get('name', 'Restaurant')}"
+                            )
+
+                            result = agent.send_email(
+                                sender_email=sender_email,
+                                sender_password=sender_password,
+                                recipient_email=restaurant_email,
+                                subject=subject_line,
+                                body=body,
+                                email_provider=email_provider
+                            )
+                            
+                            if result['success']:
+                                st.success(f"✅ {result['message']}")
+                            else:
+                                st.error(f"❌ {result['error']}")
+                    else:
+                        st.error("Failed to initialize agent")
+
+@_fragment
+def _render_bulk_send(resolved, agent, sender_email, sender_password, email_provider):
+    """Render the bulk-send section from the resolved email list."""
+    st.markdown("### 📮 Bulk Email Sending")
+    
+    # Partition from session state rather than the captured resolved
+    # list: a card edit reruns only that card's fragment, so addresses
+    # typed after the last full run are invisible in resolved. The
+    # widget keys are shared state, so every rerun of this fragment
+    # (including the Send All click) reclassifies against fresh values
+    emails_with_addresses = []
+    emails_needing_addresses = []
+    for e in resolved:
+        current = st.session_state.get(f"restaurant_email_{e['index']}") or e['restaurant_email']
+        if current:
+            emails_with_addresses.append({
+                **e,
+                'restaurant_email': current,
+                'is_extracted': current == e['extracted_email'] and bool(current)
+            })
+        else:
+            emails_needing_addresses.append(e)
+
+    # Show status of email addresses
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if emails_with_addresses:
+            st.markdown("**✅ Ready to Send:**")
+            for email_info in emails_with_addresses:
+                restaurant = email_info['restaurant']
+                status_icon = "🤖" if email_info['is_extracted'] else "✏️"
+                st.write(f"{status_icon} {restaurant.get('name', 'Restaurant')} → `{email_info['restaurant_email']}`")
+    
+    with col2:
+        if emails_needing_addresses:
+            st.markdown("**⚠️ Need Email Addresses:**")
+            for email_info in emails_needing_addresses:
+                restaurant = email_info['restaurant']
+                st.write(f"❌ {restaurant.get('name', 'Restaurant')} - Enter email above")
+    
+    if emails_with_addresses:
+        st.info(f"💡 Found {len(emails_with_addresses)} restaurants with email addresses (🤖 = auto-extracted, ✏️ = manually entered)")
+        
+        send_all = st.button(
+            f"📤 Send All {len(emails_with_addresses)} Emails",
+            type="primary",
+            disabled=not all([sender_email, sender_password])
+        )
+        
+        if send_all:
+            if agent:
+                with st.spinner("Sending all emails..."):
+                    progress_bar = st.progress(0)
+
+                    # Prepare every message first, then hand the whole batch
+                    # to the agent - one SMTP connect/STARTTLS/LOGIN for all
+                    # recipients instead of a handshake per email. Bodies
+                    # are read from session state here, at click time: the
+                    # email cards are fragment-scoped, so drafts captured
+                    # at the last full run may predate the user's edits
+                    # (recipients were already refreshed in the partition
+                    # above, which runs on the same click rerun)
+                    messages = []
+                    for email_info in emails_with_addresses:
+                        i = email_info['index']
+                        name = email_info['restaurant'].get('name', 'Restaurant')
+                        edited = st.session_state.get(f"email_{i}", email_info['email'])
+                        subject_line, body = _split_subject_body(
+                            edited, f"Table Reservation Request - {name}"
+                        )
+                        messages.append({
+                            'name': name,
+                            'recipient_email': email_info['restaurant_email'],
+                            'subject': subject_line,
+                            'body': body
+                        })
+
+                    progress_bar.progress(0.3)
+                    batch_results = agent.send_emails_batch(
+                        sender_email=sender_email,
+                        sender_password=sender_password,
+                        messages=messages,
+                        email_provider=email_provider
+                    )
+                    progress_bar.progress(1.0)
+
+                    results = [{
+                        'restaurant': r['restaurant'],
+                        'email': r.get('recipient_email'),
+                        'success': r['success'],
+                        'message': r.get('message'),
+                        'error': r.get('error')
+                    } for r in batch_results]
+
+                    # Display results
+                    st.markdown("#### 📊 Email Sending Results")
+                    
+                    success_count = sum(1 for r in results if r['success'])
+                    
+                    if success_count == len(results):
+                        st.success(f"🎉 All {len(results)} emails sent successfully!")
+                    elif success_count > 0:
+                        st.warning(f"⚠️ {success_count} out of {len(results)} emails sent successfully")
+                    else:
+                        st.error("❌ No emails were sent successfully")
+                    
+                    # Detailed results as one table render - each
+                    # st.success/st.error is a separate element diff over
+                    # the websocket, so N of them cost N roundtrips
+                    import pandas as pd
+
+                    results_df = pd.DataFrame({
+                        'Restaurant': [r['restaurant'] for r in results],
+                        'Email': [r['email'] for r in results],
+                        'Status': ['✅ Sent' if r['success'] else '❌ Failed' for r in results],
+                        'Detail': [r['message'] if r['success'] else r['error'] for r in results]
+                    }, copy=False)
+                    st.dataframe(results_df, use_container_width=True)
+            else:
+                st.error("Failed to initialize agent")
+    else:
+        st.info("💡 Enter restaurant email addresses above to enable bulk sending")
+
 def display_draft_emails(draft_emails, event_info):
     """Display drafted booking emails with email sending functionality."""
     st.markdown('<div class="sub-header">📧 Draft Booking Emails</div>', unsafe_allow_html=True)
@@ -325,7 +633,12 @@ def display_draft_emails(draft_emails, event_info):
     if not draft_emails:
         st.warning("No draft emails generated.")
         return
-    
+
+    # One agent lookup for the whole render - the config test, per-email
+    # send and bulk-send handlers below all reuse it instead of re-running
+    # the env-var/secret probes on every iteration
+    agent = initialize_agent()
+
     # Email configuration section
     with st.expander("📮 Email Configuration", expanded=False):
         st.markdown('<div class="email-section">', unsafe_allow_html=True)
@@ -361,7 +674,6 @@ def display_draft_emails(draft_emails, event_info):
             # Test email configuration
             if st.button("🔐 Test Email Configuration"):
                 if sender_email and sender_password:
-                    agent = initialize_agent()
                     if agent:
                         with st.spinner("Testing email configuration..."):
                             validation = agent.validate_email_config(
@@ -395,239 +707,39 @@ def display_draft_emails(draft_emails, event_info):
             3. Use the app password for authentication
             """)
     
-    # Individual email sending
-    st.markdown("### 📧 Individual Emails")
-    
+    # Resolve each restaurant's contact address once - both the expander
+    # widgets and the bulk-send classification below read from this list
+    # instead of repeating the email-lookup fallback twice per render
+    resolved = []
     for i, draft in enumerate(draft_emails):
         restaurant = draft['restaurant']
-        email_content = draft['email']
-        
-        with st.expander(f"📧 Email for {restaurant.get('name', f'Restaurant {i+1}')}"):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                # Display email content
-                st.text_area(
-                    f"Draft email for {restaurant.get('name', 'Restaurant')}:",
-                    value=email_content,
-                    height=300,
-                    key=f"email_{i}"
-                )
-                
-                # Restaurant contact info
-                if restaurant.get('phone'):
-                    st.write(f"📞 **Phone:** {restaurant['phone']}")
-                if restaurant.get('website'):
-                    st.write(f"🌐 **Website:** [Visit Website]({restaurant['website']})")
-            
-            with col2:
-                # Get extracted restaurant email as default
-                extracted_email = restaurant.get('email', '')
-                if not extracted_email:
-                    # Try to find email using the agent's method
-                    agent = initialize_agent()
-                    if agent:
-                        extracted_email = agent._find_restaurant_email(restaurant) or ''
-                
-                # Manual email input with extracted email as default
-                restaurant_email = st.text_input(
-                    "Restaurant Email",
-                    value=extracted_email,
-                    placeholder="restaurant@example.com" if not extracted_email else "",
-                    key=f"restaurant_email_{i}",
-                    help="Restaurant email address (auto-extracted if available)"
-                )
-                
-                # Show if email was auto-extracted
-                if extracted_email and extracted_email == restaurant_email:
-                    st.caption("✅ Auto-extracted from restaurant data")
-                elif extracted_email:
-                    st.caption("💡 Suggested email (you can edit if needed)")
-                
-                # Send individual email button
-                send_individual = st.button(
-                    f"📤 Send Email",
-                    key=f"send_{i}",
-                    type="primary",
-                    disabled=not all([sender_email, sender_password, restaurant_email])
-                )
-                
-                if send_individual:
-                    if not restaurant_email:
-                        st.error("Please enter restaurant email address")
-                    else:
-                        agent = initialize_agent()
-                        if agent:
-                            with st.spinner(f"Sending email to {restaurant.get('name', 'restaurant')}..."):
-                                # Get the edited email content from the text area widget
-                                edited_email_content = st.session_state.get(f"email_{i}", email_content)
-                                
-                                # Extract subject and body from edited email content
-                                lines = edited_email_content.split('\n')
-                                subject_line = None
-                                body_lines = []
-                                
-                                for line in lines:
-                                    if line.startswith('Subject:'):
-                                        subject_line = line.replace('Subject:', '').strip()
-                                    elif subject_line is not None:
-                                        body_lines.append(line)
-                                
-                                if not subject_line:
-                                    subject_line = f"Table Reservation Request - {restaurant.get('name', 'Restaurant')}"
-                                
-                                body = '\n'.join(body_lines).strip()
-                                
-                                result = agent.send_email(
-                                    sender_email=sender_email,
-                                    sender_password=sender_password,
-                                    recipient_email=restaurant_email,
-                                    subject=subject_line,
-                                    body=body,
-                                    email_provider=email_provider
-                                )
-                                
-                                if result['success']:
-                                    st.success(f"✅ {result['message']}")
-                                else:
-                                    st.error(f"❌ {result['error']}")
-                        else:
-                            st.error("Failed to initialize agent")
-    
-    # Bulk email sending section
-    st.markdown("### 📮 Bulk Email Sending")
-    
-    # Check which emails have restaurant addresses (including extracted ones)
-    emails_with_addresses = []
-    emails_needing_addresses = []
-    
-    for i, draft in enumerate(draft_emails):
-        restaurant = draft['restaurant']
-        
-        # Check for manually entered email first
-        restaurant_email = st.session_state.get(f'restaurant_email_{i}')
-        
-        # If no manual email, try to get extracted email
-        if not restaurant_email:
-            extracted_email = restaurant.get('email', '')
-            if not extracted_email:
-                agent = initialize_agent()
-                if agent:
-                    extracted_email = agent._find_restaurant_email(restaurant) or ''
-            restaurant_email = extracted_email
-        
-        if restaurant_email:
-            emails_with_addresses.append({
-                'index': i,
-                'restaurant': restaurant,
-                'email': draft['email'],
-                'restaurant_email': restaurant_email,
-                'is_extracted': restaurant_email == restaurant.get('email', '') or 
-                               (not st.session_state.get(f'restaurant_email_{i}') and restaurant_email)
-            })
-        else:
-            emails_needing_addresses.append({
-                'index': i,
-                'restaurant': restaurant,
-                'email': draft['email']
-            })
-    
-    # Show status of email addresses
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if emails_with_addresses:
-            st.markdown("**✅ Ready to Send:**")
-            for email_info in emails_with_addresses:
-                restaurant = email_info['restaurant']
-                status_icon = "🤖" if email_info['is_extracted'] else "✏️"
-                st.write(f"{status_icon} {restaurant.get('name', 'Restaurant')} → `{email_info['restaurant_email']}`")
-    
-    with col2:
-        if emails_needing_addresses:
-            st.markdown("**⚠️ Need Email Addresses:**")
-            for email_info in emails_needing_addresses:
-                restaurant = email_info['restaurant']
-                st.write(f"❌ {restaurant.get('name', 'Restaurant')} - Enter email above")
-    
-    if emails_with_addresses:
-        st.info(f"💡 Found {len(emails_with_addresses)} restaurants with email addresses (🤖 = auto-extracted, ✏️ = manually entered)")
-        
-        send_all = st.button(
-            f"📤 Send All {len(emails_with_addresses)} Emails",
-            type="primary",
-            disabled=not all([sender_email, sender_password])
-        )
-        
-        if send_all:
-            agent = initialize_agent()
-            if agent:
-                with st.spinner("Sending all emails..."):
-                    progress_bar = st.progress(0)
-                    results = []
-                    
-                    for i, email_info in enumerate(emails_with_addresses):
-                        # Get the edited email content from the text area widget
-                        original_index = email_info['index']
-                        edited_email_content = st.session_state.get(f"email_{original_index}", email_info['email'])
-                        
-                        # Extract subject and body from edited content
-                        lines = edited_email_content.split('\n')
-                        subject_line = None
-                        body_lines = []
-                        
-                        for line in lines:
-                            if line.startswith('Subject:'):
-                                subject_line = line.replace('Subject:', '').strip()
-                            elif subject_line is not None:
-                                body_lines.append(line)
-                        
-                        if not subject_line:
-                            subject_line = f"Table Reservation Request - {email_info['restaurant'].get('name', 'Restaurant')}"
-                        
-                        body = '\n'.join(body_lines).strip()
-                        
-                        result = agent.send_email(
-                            sender_email=sender_email,
-                            sender_password=sender_password,
-                            recipient_email=email_info['restaurant_email'],
-                            subject=subject_line,
-                            body=body,
-                            email_provider=email_provider
-                        )
-                        
-                        results.append({
-                            'restaurant': email_info['restaurant'].get('name', f'Restaurant {i+1}'),
-                            'email': email_info['restaurant_email'],
-                            'success': result['success'],
-                            'message': result.get('message'),
-                            'error': result.get('error')
-                        })
-                        
-                        progress_bar.progress((i + 1) / len(emails_with_addresses))
-                    
-                    # Display results
-                    st.markdown("#### 📊 Email Sending Results")
-                    
-                    success_count = sum(1 for r in results if r['success'])
-                    
-                    if success_count == len(results):
-                        st.success(f"🎉 All {len(results)} emails sent successfully!")
-                    elif success_count > 0:
-                        st.warning(f"⚠️ {success_count} out of {len(results)} emails sent successfully")
-                    else:
-                        st.error("❌ No emails were sent successfully")
-                    
-                    # Detailed results
-                    for result in results:
-                        if result['success']:
-                            st.success(f"✅ {result['restaurant']}: {result['message']}")
-                        else:
-                            st.error(f"❌ {result['restaurant']}: {result['error']}")
-            else:
-                st.error("Failed to initialize agent")
-    else:
-        st.info("💡 Enter restaurant email addresses above to enable bulk sending")
+        extracted_email = restaurant.get('email', '')
+        if not extracted_email:
+            # Cached lookup keyed by restaurant identity (see helper)
+            extracted_email = _cached_find_email(
+                restaurant.get('place_id', ''),
+                restaurant.get('name', ''),
+                restaurant.get('website', '')
+            )
+        manual_email = st.session_state.get(f'restaurant_email_{i}')
+        restaurant_email = manual_email or extracted_email
+        resolved.append({
+            'index': i,
+            'restaurant': restaurant,
+            'email': draft['email'],
+            'extracted_email': extracted_email,
+            'restaurant_email': restaurant_email,
+            'is_extracted': restaurant_email == restaurant.get('email', '') or
+                           (not manual_email and bool(restaurant_email))
+        })
+
+    # Individual email sending
+    st.markdown("### 📧 Individual Emails")
+
+    for entry in resolved:
+        _render_email_card(entry, agent, sender_email, sender_password, email_provider)
+
+    _render_bulk_send(resolved, agent, sender_email, sender_password, email_provider)
 
 def main():
     """Main Streamlit application."""
@@ -647,9 +759,8 @@ def main():
     with st.sidebar:
         st.markdown("## ⚙️ Configuration")
         
-        # Check API status
-        vertex_project_id = os.getenv('VERTEX_PROJECT_ID') or st.secrets.get('VERTEX_PROJECT_ID', '')
-        google_maps_api_key = os.getenv('GOOGLE_MAPS_API_KEY') or st.secrets.get('GOOGLE_MAPS_API_KEY', '')
+        # Check API status (resolved once and cached)
+        vertex_project_id, google_maps_api_key = _get_config()
         
         # API Status
         st.markdown("### 🔑 API Status")
@@ -709,26 +820,14 @@ def main():
             help="Paste the URL of the event you want to analyze"
         )
         
-        # Validate URL format
+        # Validate URL format (pattern compiled once at module scope)
         if event_url:
-            import re
-            url_pattern = re.compile(
-                r'^https?://'  # http:// or https://
-                r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-                r'localhost|'  # localhost...
-                r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-                r'(?::\d+)?'  # optional port
-                r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-            
-            if not url_pattern.match(event_url):
+            if not _URL_RE.match(event_url):
                 st.warning("⚠️ Please enter a valid URL starting with http:// or https://")
                 event_url = None
         
         # Check if API keys are available for button state
-        api_keys_available = bool(
-            (os.getenv('VERTEX_PROJECT_ID') or st.secrets.get('VERTEX_PROJECT_ID', '')) and
-            (os.getenv('GOOGLE_MAPS_API_KEY') or st.secrets.get('GOOGLE_MAPS_API_KEY', ''))
-        )
+        api_keys_available = all(_get_config())
         
         process_button = st.button(
             "🚀 Process Event",
@@ -740,101 +839,130 @@ def main():
     
     # Process event when button is clicked
     if process_button and event_url:
-        # Initialize agent
-        agent = initialize_agent()
-        print(agent)
-        if not agent:
-            st.error("Failed to initialize agent. Please check your API credentials.")
-            return
+        # Re-clicking Process with the same URL and settings would re-run
+        # the whole pipeline, including the per-restaurant LLM drafting.
+        # If nothing changed, the results already in session state are valid
+        run_key = hashlib.md5(
+            f"{event_url}|{party_size}|{search_radius}".encode()
+        ).hexdigest()
+        if st.session_state.get('_run_key') == run_key and st.session_state.get('draft_emails'):
+            st.markdown('<div class="info-box">✅ Same URL and settings as the last run - showing cached results</div>', unsafe_allow_html=True)
+            display_event_info(st.session_state.get('event_info', {}))
+            display_restaurants(st.session_state.get('restaurants', []))
+            display_draft_emails(st.session_state.get('draft_emails', []), st.session_state.get('event_info', {}))
+        else:
+            # Initialize agent
+            agent = initialize_agent()
+            print(agent)
+            if not agent:
+                st.error("Failed to initialize agent. Please check your API credentials.")
+                return
         
-        # Create progress indicators
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+            # Create progress indicators
+            progress_bar = st.progress(0)
+            status_text = st.empty()
         
-        try:
-            # Step 1: Extract event information
-            status_text.text("🔍 Extracting event information...")
-            progress_bar.progress(25)
+            try:
+                # Step 1: Extract event information
+                status_text.text("🔍 Extracting event information...")
+                progress_bar.progress(25)
             
-            with st.spinner("Analyzing event page..."):
-                event_info = agent.extract_event_info(event_url)
+                with st.spinner("Analyzing event page..."):
+                    event_info = agent.extract_event_info(event_url)
             
-            if 'error' in event_info:
-                st.error(f"Failed to extract event information: {event_info['error']}")
-                return
+                if 'error' in event_info:
+                    st.error(f"Failed to extract event information: {event_info['error']}")
+                    return
             
-            # Step 2: Search restaurants
-            status_text.text("🍽️ Searching for nearby restaurants...")
-            progress_bar.progress(50)
+                # Step 2: Search restaurants
+                status_text.text("🍽️ Searching for nearby restaurants...")
+                progress_bar.progress(50)
             
-            with st.spinner("Finding restaurants..."):
-                restaurants = agent.search_restaurants(event_info, radius=int(search_radius * 1000))
+                with st.spinner("Finding restaurants..."):
+                    restaurants = agent.search_restaurants(event_info, radius=int(search_radius * 1000))
             
-            # Step 2.5: Extract restaurant emails
-            if restaurants:
-                status_text.text("📧 Extracting restaurant contact information...")
-                progress_bar.progress(60)
+                # Step 2.5: Extract restaurant emails
+                if restaurants:
+                    status_text.text("📧 Extracting restaurant contact information...")
+                    progress_bar.progress(60)
                 
-                with st.spinner("Finding restaurant emails..."):
-                    for restaurant in restaurants:
-                        if not restaurant.get('email'):
-                            email = agent._find_restaurant_email(restaurant)
-                            if email:
-                                restaurant['email'] = email
-            
-            # Step 3: Draft emails
-            status_text.text("📧 Drafting booking emails...")
-            progress_bar.progress(75)
-            
-            draft_emails = []
-            with st.spinner("Generating emails..."):
-                for restaurant in restaurants[:5]:  # Top 5 restaurants
-                    email = agent.draft_booking_email(event_info, restaurant, party_size)
-                    draft_emails.append({
-                        'restaurant': restaurant,
-                        'email': email
-                    })
+                    with st.spinner("Finding restaurant emails..."):
+                        # Each lookup is an independent scrape/API round trip,
+                        # so fan them out instead of paying the sum serially
+                        targets = [r for r in restaurants if not r.get('email')]
+                        if targets:
+                            with ThreadPoolExecutor(max_workers=10) as pool:
+                                for restaurant, email in zip(
+                                    targets, pool.map(agent._find_restaurant_email, targets)
+                                ):
+                                    if email:
+                                        restaurant['email'] = email
             
-            # Complete
-            status_text.text("✅ Processing complete!")
-            progress_bar.progress(100)
+                # Step 3: Draft emails
+                status_text.text("📧 Drafting booking emails...")
+                progress_bar.progress(75)
             
-            # Store results in session state for email functionality
-            st.session_state['event_info'] = event_info
-            st.session_state['restaurants'] = restaurants
-            st.session_state['draft_emails'] = draft_emails
+                with st.spinner("Generating emails..."):
+                    # Each draft is an independent LLM round trip - generate
+                    # them concurrently and keep the display order
+                    top_restaurants = restaurants[:5]  # Top 5 restaurants
+                    with ThreadPoolExecutor(max_workers=5) as pool:
+                        emails = list(pool.map(
+                            lambda r: agent.draft_booking_email(event_info, r, party_size),
+                            top_restaurants
+                        ))
+                    draft_emails = [
+                        {'restaurant': restaurant, 'email': email}
+                        for restaurant, email in zip(top_restaurants, emails)
+                    ]
             
-            # Display results
-            st.markdown('<div class="success-box">🎉 Event processing completed successfully!</div>', unsafe_allow_html=True)
+                # Complete
+                status_text.text("✅ Processing complete!")
+                progress_bar.progress(100)
             
-            # Display event information
-            display_event_info(event_info)
+                # Store results in session state for email functionality
+                st.session_state['_run_key'] = run_key
+                st.session_state['event_info'] = event_info
+                st.session_state['restaurants'] = restaurants
+                st.session_state['draft_emails'] = draft_emails
             
-            # Display restaurants
-            display_restaurants(restaurants)
+                # Display results
+                st.markdown('<div class="success-box">🎉 Event processing completed successfully!</div>', unsafe_allow_html=True)
             
-            # Display draft emails with sending functionality
-            display_draft_emails(draft_emails, event_info)
+                # Display event information
+                display_event_info(event_info)
             
-            # Summary
-            st.markdown('<div class="sub-header">📊 Summary</div>', unsafe_allow_html=True)
-            summary_col1, summary_col2, summary_col3 = st.columns(3)
+                # Display restaurants
+                display_restaurants(restaurants)
             
-            with summary_col1:
-                st.metric("Event Found", "✅" if event_info.get('title') else "❌")
+                # Display draft emails with sending functionality
+                display_draft_emails(draft_emails, event_info)
             
-            with summary_col2:
-                st.metric("Restaurants Found", len(restaurants))
-            
-            with summary_col3:
-                st.metric("Emails Drafted", len(draft_emails))
+                # Summary - compute the three metric values once
+                summary = (
+                    "✅" if event_info.get('title') else "❌",
+                    len(restaurants),
+                    len(draft_emails)
+                )
+
+                st.markdown('<div class="sub-header">📊 Summary</div>', unsafe_allow_html=True)
+                summary_col1, summary_col2, summary_col3 = st.columns(3)
+
+                with summary_col1:
+                    st.metric("Event Found", summary[0])
+
+                with summary_col2:
+                    st.metric("Restaurants Found", summary[1])
+
+                with summary_col3:
+                    st.metric("Emails Drafted", summary[2])
                 
-        except Exception as e:
-            st.error(f"An error occurred: {str(e)}")
-            st.exception(e)
-        finally:
-            progress_bar.empty()
-            status_text.empty()
+            except Exception as e:
+                st.error(f"An error occurred: {str(e)}")
+                st.exception(e)
+            finally:
+                progress_bar.empty()
+                status_text.empty()
     
     # Display existing results if available (for when user returns to configure email)
     elif st.session_state.get('draft_emails'):
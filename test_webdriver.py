@@ -3,31 +3,64 @@
 Test script to diagnose Chrome WebDriver issues
 """
 
+import io
 import os
+import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# ChromeDriverManager().install() hits the chromedriver metadata server
+# and walks the download cache every call - do it once per process. The
+# lock matters because the tests run concurrently from main()
+_driver_path = None
+_driver_lock = threading.Lock()
+
+def _get_driver_path():
+    """Install ChromeDriver once and reuse the path on later calls."""
+    global _driver_path
+    with _driver_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
 def test_chrome_installation():
     """Test if Chrome is installed."""
     print("🔍 Testing Chrome installation...")
-    
-    # Common Chrome paths
-    chrome_paths = [
-        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',  # macOS
-        '/usr/bin/google-chrome',  # Linux
-        '/usr/bin/chromium-browser',  # Linux alternative
-        'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',  # Windows
-        'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe'  # Windows 32-bit
-    ]
-    
+
+    # Fast path: one PATH walk catches most installs, including ones in
+    # unusual prefixes (Homebrew, Nix) the hardcoded list below misses
+    path = (shutil.which('google-chrome') or shutil.which('chromium-browser')
+            or shutil.which('chromium') or shutil.which('chrome'))
+    if path:
+        print(f"✅ Found Chrome at: {path}")
+        return True
+
+    # Fallback: only stat the absolute paths plausible on this platform
+    if sys.platform == 'darwin':
+        chrome_paths = [
+            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+        ]
+    elif sys.platform.startswith('win'):
+        chrome_paths = [
+            'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
+            'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe'
+        ]
+    else:
+        chrome_paths = [
+            '/usr/bin/google-chrome',
+            '/usr/bin/chromium-browser'
+        ]
+
     for path in chrome_paths:
         if os.path.exists(path):
             print(f"✅ Found Chrome at: {path}")
             return True
-    
+
     print("❌ Chrome not found in common locations")
     return False
 
@@ -36,7 +69,7 @@ def test_chromedriver_manager():
     print("\n🔍 Testing ChromeDriverManager...")
     
     try:
-        driver_path = ChromeDriverManager().install()
+        driver_path = _get_driver_path()
         print(f"✅ ChromeDriverManager installed driver at: {driver_path}")
         return True
     except Exception as e:
@@ -51,14 +84,28 @@ def test_basic_webdriver():
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    # No images and eager loading: the probe itself never navigates, but
+    # if a future probe does, it returns at DOMContentLoaded and skips
+    # image bytes entirely
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    chrome_options.page_load_strategy = 'eager'
     
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(_get_driver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.get("https://www.google.com")
-        title = driver.title
+        # One DevTools roundtrip proves the command channel works -
+        # no need to render a real page, which costs seconds
+        user_agent = driver.execute_script("return navigator.userAgent")
         driver.quit()
-        print(f"✅ Basic WebDriver test successful. Page title: {title}")
+        print(f"✅ Basic WebDriver test successful. UA: {user_agent[:40]}...")
         return True
     except Exception as e:
         print(f"❌ Basic WebDriver test failed: {e}")
@@ -72,13 +119,25 @@ def test_fallback_webdriver():
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    # No images and eager loading: the probe itself never navigates, but
+    # if a future probe does, it returns at DOMContentLoaded and skips
+    # image bytes entirely
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    chrome_options.page_load_strategy = 'eager'
     
     try:
         driver = webdriver.Chrome(options=chrome_options)
-        driver.get("https://www.google.com")
-        title = driver.title
+        user_agent = driver.execute_script("return navigator.userAgent")
         driver.quit()
-        print(f"✅ Fallback WebDriver test successful. Page title: {title}")
+        print(f"✅ Fallback WebDriver test successful. UA: {user_agent[:40]}...")
         return True
     except Exception as e:
         print(f"❌ Fallback WebDriver test failed: {e}")
@@ -120,6 +179,45 @@ def provide_solutions():
     print("   - Use the requests fallback (no dynamic content)")
     print("   - Run without headless mode for debugging")
 
+class _ThreadLocalStdout:
+    """stdout proxy that routes writes to a per-thread buffer.
+
+    redirect_stdout swaps the process-global sys.stdout, so under the
+    concurrent test pool one test's prints would land in another's
+    buffer (or leak to the terminal). This proxy dispatches each write
+    to the buffer registered by the current thread, falling back to the
+    real stdout for unregistered threads like the main one.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buf):
+        self._local.buf = buf
+
+    def write(self, s):
+        return getattr(self._local, 'buf', self._fallback).write(s)
+
+    def flush(self):
+        getattr(self._local, 'buf', self._fallback).flush()
+
+def _run_buffered(test):
+    """Run one test with its prints captured into a per-thread buffer.
+
+    The tests run concurrently in main(), so each one writes to its own
+    StringIO and the buffers are flushed in submission order - parallel
+    speed with serial-looking output.
+    """
+    buf = io.StringIO()
+    sys.stdout.register(buf)
+    try:
+        result = test()
+    except Exception as e:
+        buf.write(f"❌ Test failed with exception: {e}\n")
+        result = False
+    return result, buf.getvalue()
+
 def main():
     """Main test function."""
     print("🧪 Chrome WebDriver Diagnostic Tool")
@@ -134,14 +232,20 @@ def main():
         test_event_agent_import
     ]
     
+    # The probes are independent and dominated by network and browser
+    # startup, not CPU - running them together drops wall-clock time
+    # from the sum of the tests to roughly the slowest one
     results = []
-    for test in tests:
-        try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
-            results.append(False)
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadLocalStdout(real_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+            outcomes = list(pool.map(_run_buffered, tests))
+    finally:
+        sys.stdout = real_stdout
+    for result, output in outcomes:
+        print(output, end='')
+        results.append(result)
     
     # Summary
     print("\n📊 Test Summary:")